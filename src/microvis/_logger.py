@@ -25,7 +25,8 @@ else:
     )
 
 DEBUG = os.getenv("DEBUG", "0") in ("1", "true", "True", "yes")
-DEFAULT_LOG_LEVEL = "DEBUG" if DEBUG else "INFO"
+# debug records are only emitted (and formatted) when DEBUG is set
+DEFAULT_LOG_LEVEL = "DEBUG" if DEBUG else "WARNING"
 
 # automatically log to stderr
 # TODO: add file outputs
@@ -28,7 +28,7 @@ class Image(Node):
                 "interpolation": image.interpolation.value,
             }
         )
-        self._native = scene.Image(image.data, **backend_kwargs)
+        self._native = scene.Image(image.data_raw, **backend_kwargs)
 
     def _viz_set_cmap(self, arg: str) -> None:
         self._native.cmap = str(arg)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from functools import lru_cache
 from importlib import import_module
+from types import ModuleType
 from typing import Any, ClassVar, Generic, Protocol, TypeVar, cast
 
 import numpy as np
@@ -110,15 +111,14 @@ class FrontEndFor(ModelBase, Generic[T]):
 
         if backend in self._backend_lookup:
             backend_class = self._backend_lookup[backend]
-            logger.debug(f"Using class-provided backend class: {backend_class}")
+            logger.debug("Using class-provided backend class: {}", backend_class)
         else:
             class_name = class_name or type(self).__name__
-            backend_module = import_module(f"...backend.{backend}", __name__)
-            backend_class = getattr(backend_module, class_name)
+            backend_class = getattr(_load_backend(backend), class_name)
 
         # TODO: fix TypeGuard
         backend_class = validate_backend_class(type(self), backend_class)
-        logger.debug(f"Attaching {type(self)} to backend {backend_class}")
+        logger.debug("Attaching {} to backend {}", type(self), backend_class)
         return cast("T", backend_class(self, **(backend_kwargs or {})))
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -141,8 +141,9 @@ class FrontEndFor(ModelBase, Generic[T]):
             logger.exception(e)
             return
 
-        event_name = f"{type(self).__name__}.{signal_name}"
-        logger.debug(f"{event_name}={args} emitting to backend")
+        logger.debug(
+            "{}.{}={} emitting to backend", type(self).__name__, signal_name, args
+        )
 
         try:
             setter(*args)
@@ -150,10 +151,16 @@ class FrontEndFor(ModelBase, Generic[T]):
             logger.exception(e)
 
 
+@lru_cache(maxsize=4)
+def _load_backend(name: str) -> ModuleType:
+    """Import (once) and return the backend module `microvis.backend.<name>`."""
+    return import_module(f"...backend.{name}", __name__)
+
+
 @lru_cache
 def validate_backend_class(cls: type[FrontEndFor], backend_class: type[T]) -> type[T]:
     """Validate that the backend class is appropriate for the object."""
-    logger.debug(f"Validating backend class {backend_class} for {cls}")
+    logger.debug("Validating backend class {} for {}", backend_class, cls)
     if missing := {
         SETTER_METHOD.format(name=signal._name)
         for signal in cls.__signal_group__._signals_.values()
@@ -2,14 +2,22 @@ from __future__ import annotations
 
 import functools
 import math
+import threading
 from functools import reduce
 from typing import Any, Callable, Generator, Iterable, Sequence, Sized, cast
 
 import numpy as np
 from numpy.typing import ArrayLike, DTypeLike, NDArray
+from pydantic import PrivateAttr
 
 from ._base import Field, ModelBase
 
+_IDENTITY = np.eye(4)
+_IDENTITY.flags.writeable = False
+# per-element tolerance equivalent to np.allclose(..., _IDENTITY) defaults
+_NULL_TOL = 1e-8 + 1e-5 * _IDENTITY
+_NULL_TOL.flags.writeable = False
+
 
 def _arg_to_vec4(
     func: Callable[[Transform, ArrayLike], NDArray]
@@ -32,12 +40,13 @@ def _arg_to_vec4(
     def wrapper(self_: Transform, arg: ArrayLike) -> NDArray:
         if not isinstance(arg, (tuple, list, np.ndarray)):
             raise TypeError(f"Cannot convert argument to 4D vector: {arg!r}")
-        arg = np.array(arg)
+        arg = np.asarray(arg)
         flatten = arg.ndim == 1
         arg = as_vec4(arg)
 
         ret = func(self_, arg)
-        return np.copy(np.ravel(ret)) if flatten and ret is not None else ret
+        # `ret` is always freshly computed, so a view of it needs no copy
+        return np.ravel(ret) if flatten and ret is not None else ret
 
     return wrapper
 
@@ -46,19 +55,39 @@ class Transform(ModelBase):
     """Transformation."""
 
     matrix: np.ndarray = Field(default_factory=lambda: np.eye(4))
+    # lazily computed inverse of `matrix`. The model is frozen and `matrix` is a
+    # read-only array owned by the Transform; `copy` resets it if `matrix` changes.
+    _inv_matrix: np.ndarray | None = PrivateAttr(None)
+    # `matrix` and its inverse cast to other dtypes, keyed by (inverse, dtype).
+    # Created on first use, so that most Transforms never allocate it.
+    _cast_cache: dict[tuple[bool, np.dtype], np.ndarray] | None = PrivateAttr(None)
 
     class Config:
         arbitrary_types_allowed = True
         frozen = True
 
     def __array__(self, dtype: DTypeLike | None = None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self.matrix.dtype:
+            # no copy, but never hand out a writeable alias of the (cached) matrix
+            view = self.matrix.view()
+            view.flags.writeable = False
+            return view
         return self.matrix.astype(dtype)
 
     def __init__(_model_self_, matrix: ArrayLike | None = None) -> None:
-        matrix = np.eye(4) if matrix is None else np.asarray(matrix, dtype=float)
-        if matrix.shape != (4, 4):
-            raise ValueError(f"Expected 4x4 matrix, got {matrix.shape}")
-        super().__init__(matrix=matrix)
+        super().__init__(matrix=_owned_matrix(matrix))
+
+    def _copy_and_set_values(
+        self, values: dict[str, Any], fields_set: set[str], *, deep: bool
+    ) -> Transform:
+        # used by `copy`: pydantic carries private attributes over to the copy, so
+        # drop the caches if the copy has a different (e.g. `update`d) matrix.
+        new = super()._copy_and_set_values(values, fields_set, deep=deep)
+        if "matrix" in values and values["matrix"] is not self.matrix:
+            object.__setattr__(new, "matrix", _owned_matrix(values["matrix"]))
+            new._inv_matrix = None
+            new._cast_cache = None
+        return new
 
     def __repr_args__(self) -> Sequence[tuple[str | None, Any]]:
         return [] if self.is_null() else [(None, self.matrix)]
@@ -77,29 +106,66 @@ class Transform(ModelBase):
             return cls(matrix=v)
         raise TypeError(f"Cannot convert {v!r} to Transform")
 
+    @classmethod
+    def _wrap(cls, matrix: np.ndarray) -> Transform:
+        """Wrap a 4x4 float `matrix` known to be valid, skipping validation.
+
+        For results of internal arithmetic only. `construct` bypasses
+        `EventedModel.__init__`, so the `events` group is created here.
+        """
+        matrix.flags.writeable = False
+        obj = cls.construct(matrix=matrix)
+        obj._events = cls.__signal_group__(obj)  # type: ignore [misc]
+        return obj
+
     def is_null(self) -> bool:
-        return np.allclose(self.matrix, np.eye(4))
+        # same result as np.allclose(self.matrix, np.eye(4)), minus the overhead
+        return bool((np.abs(self.matrix - _IDENTITY) <= _NULL_TOL).all())
 
     def __matmul__(self, other: Transform | ArrayLike) -> Transform:
         """Return the dot product of this transform with another."""
-        if isinstance(other, Transform):
-            other = other.matrix
-        return Transform(matrix=self.matrix @ other)
+        # np.dot has noticeably less dispatch overhead than the matmul ufunc for
+        # small 2D operands like these.
+        return self.dot(other)
 
     def dot(self, other: Transform | ArrayLike) -> Transform:
         """Return the dot product of this transform with another."""
         if isinstance(other, Transform):
-            other = other.matrix
+            return self._wrap(np.dot(self.matrix, other.matrix))
         return Transform(matrix=np.dot(self.matrix, other))
 
     @property
     def T(self) -> Transform:
         """Return the transpose of the transform."""
-        return Transform(matrix=self.matrix.T)
+        return self._wrap(self.matrix.T)
+
+    def _inverse_matrix(self) -> np.ndarray:
+        """Return the (cached) inverse of `self.matrix`."""
+        if self._inv_matrix is None:
+            self._inv_matrix = _affine_inv(self.matrix)
+        return self._inv_matrix
+
+    def _matrix_for(self, coords: ArrayLike, inverse: bool = False) -> np.ndarray:
+        """Return `matrix` (or its inverse) in the dtype to use for `coords`.
+
+        float32 input stays float32 (rather than being upcast to float64); the cast
+        matrix is cached. Everything else, including small integer types, uses the
+        float64 matrix.
+        """
+        matrix = self._inverse_matrix() if inverse else self.matrix
+        dtype = np.result_type(coords)
+        if dtype != np.float32:
+            return matrix
+        if self._cast_cache is None:
+            self._cast_cache = {}
+        key = (inverse, dtype)
+        if key not in self._cast_cache:
+            self._cast_cache[key] = matrix.astype(dtype)
+        return self._cast_cache[key]
 
     def inv(self) -> Transform:
         """Return the inverse of the transform."""
-        return Transform(matrix=np.linalg.inv(self.matrix))
+        return self._wrap(self._inverse_matrix().copy())
 
     def translated(self, pos: ArrayLike) -> Transform:
         """Return new transform, translated by pos.
@@ -112,8 +178,11 @@ class Transform(ModelBase):
         pos : ArrayLike
             Position (x, y, z) to translate by.
         """
-        pos = as_vec4(np.array(pos))
-        return self.dot(translate(pos[0, :3]))
+        pos = _as_vec3(pos)
+        # equivalent to self.dot(translate(pos)), without building the 4x4
+        matrix = self.matrix.copy()
+        matrix[:, :3] += matrix[:, 3:] * pos
+        return self._wrap(matrix)
 
     def rotated(
         self, angle: float, axis: ArrayLike, about: ArrayLike | None = None
@@ -133,10 +202,12 @@ class Transform(ModelBase):
             The x, y and z coordinates to rotate around. If None, will rotate around
             the origin (0, 0, 0).
         """
+        _rotate = rotate(angle, axis, out=_scratch4x4())
         if about is not None:
-            about = as_vec4(about)[0, :3]
-            return self.translated(-about).dot(rotate(angle, axis)).translated(about)
-        return self.dot(rotate(angle, axis))
+            # fold translate(-about) @ R @ translate(about) into R directly
+            about = _as_vec3(about)
+            _rotate[3, :3] = about - about @ _rotate[:3, :3]
+        return self._wrap(np.dot(self.matrix, _rotate))
 
     def scaled(
         self, scale_factor: ArrayLike, center: ArrayLike | None = None
@@ -154,11 +225,13 @@ class Transform(ModelBase):
             The x, y and z coordinates to scale around. If None,
             (0, 0, 0) will be used.
         """
-        _scale = scale(as_vec4(scale_factor, default=(1, 1, 1, 1))[0, :3])
+        factor = _as_vec3(scale_factor, default=1)
+        _scale = scale(factor, out=_scratch4x4())
         if center is not None:
-            center = as_vec4(center)[0, :3]
-            _scale = np.dot(np.dot(translate(-center), _scale), translate(center))
-        return self.dot(_scale)
+            # fold translate(-center) @ S @ translate(center) into S directly
+            center = _as_vec3(center)
+            _scale[3, :3] = center * (1 - factor)
+        return self._wrap(np.dot(self.matrix, _scale))
 
     @_arg_to_vec4
     def map(self, coords: ArrayLike) -> NDArray:
@@ -174,8 +247,10 @@ class Transform(ModelBase):
         coords : ndarray
             Coordinates.
         """
+        matrix = self._matrix_for(coords)
+        coords = np.ascontiguousarray(coords, dtype=matrix.dtype)
         # looks backwards, but both matrices are transposed.
-        return cast(NDArray, np.dot(coords, self.matrix))
+        return cast(NDArray, np.dot(coords, matrix))
 
     @_arg_to_vec4
     def imap(self, coords: ArrayLike) -> NDArray:
@@ -191,7 +266,17 @@ class Transform(ModelBase):
         coords : ndarray
             Coordinates.
         """
-        return cast(NDArray, np.dot(coords, np.linalg.inv(self.matrix)))
+        if not _is_affine(self.matrix):
+            # solve the (transposed) system directly rather than forming an
+            # explicit inverse of a projective matrix, which is less accurate.
+            matrix = self._matrix_for(coords)
+            coords = np.asarray(coords, dtype=matrix.dtype)
+            solved = np.linalg.solve(matrix.T, coords.reshape(-1, 4).T)
+            return cast(NDArray, solved.T.reshape(coords.shape))
+
+        matrix = self._matrix_for(coords, inverse=True)
+        coords = np.ascontiguousarray(coords, dtype=matrix.dtype)
+        return cast(NDArray, np.dot(coords, matrix))
 
     @classmethod
     def chain(cls, *transforms: Transform) -> Transform:
@@ -207,13 +292,60 @@ class Transform(ModelBase):
         transform : Transform
             Chained transform.
         """
-        return reduce(lambda a, b: a @ b, transforms, cls())
+        # multiply the raw matrices, skipping exact identities (not is_null(), whose
+        # tolerance would drop tiny but real offsets/scales), and wrap only once.
+        matrices = [
+            t.matrix for t in transforms if not np.array_equal(t.matrix, _IDENTITY)
+        ]
+        return cls._wrap(reduce(np.dot, matrices)) if matrices else cls()
+
+
+def _is_affine(M: np.ndarray) -> bool:
+    """Return True if the (transposed) 4x4 matrix `M` is affine."""
+    return bool(M[0, 3] == 0 and M[1, 3] == 0 and M[2, 3] == 0 and M[3, 3] == 1)
+
+
+def _affine_inv(M: np.ndarray) -> np.ndarray:
+    """Return the inverse of 4x4 matrix `M`, using a closed form for affine `M`.
+
+    Matrices here are transposed (row-vector convention, as in vispy), so `M` is
+    affine when its last *column* is (0, 0, 0, 1). The inverse is then the inverse
+    of the upper-left 3x3 block (computed via its adjugate), with the translation
+    row mapped through it. Falls back to `np.linalg.inv` for non-affine matrices.
+    """
+    if not _is_affine(M):
+        return np.linalg.inv(M)
+
+    a, b, c, _, d, e, f, _, g, h, i, _, tx, ty, tz, _ = M.ravel().tolist()
+    # cofactors of the first row
+    A, B, C = e * i - f * h, f * g - d * i, d * h - e * g
+    det = a * A + b * B + c * C
+    if det == 0:
+        raise np.linalg.LinAlgError("Singular matrix")
+    r = 1.0 / det
+    # inverse of the 3x3 block: transposed cofactor matrix / det
+    r00, r01, r02 = A * r, (c * h - b * i) * r, (b * f - c * e) * r
+    r10, r11, r12 = B * r, (a * i - c * g) * r, (c * d - a * f) * r
+    r20, r21, r22 = C * r, (b * g - a * h) * r, (a * e - b * d) * r
+    # fmt: off
+    return np.array(
+        (
+            r00, r01, r02, 0.0,
+            r10, r11, r12, 0.0,
+            r20, r21, r22, 0.0,
+            -(tx * r00 + ty * r10 + tz * r20),
+            -(tx * r01 + ty * r11 + tz * r21),
+            -(tx * r02 + ty * r12 + tz * r22),
+            1.0,
+        )
+    ).reshape(4, 4)
+    # fmt: on
 
 
 # from vispy ...
 
 
-def rotate(angle: float, axis: ArrayLike) -> np.ndarray:
+def rotate(angle: float, axis: ArrayLike, out: np.ndarray | None = None) -> np.ndarray:
     """Return 4x4 rotation matrix for rotation about a vector.
 
     Parameters
@@ -222,35 +354,58 @@ def rotate(angle: float, axis: ArrayLike) -> np.ndarray:
         The angle of rotation, in degrees.
     axis : ndarray
         The x, y, z coordinates of the axis direction vector.
+    out : ndarray, optional
+        A 4x4 float array to write the matrix into, instead of allocating a new one.
 
     Returns
     -------
     M : ndarray
         Transformation matrix describing the rotation.
     """
-    angle = np.radians(angle)
-    axis = np.array(axis, copy=False)
-    if len(axis) != 3:
+    _axis: tuple[float, ...] = tuple(axis)  # type: ignore [arg-type]
+    if len(_axis) != 3:
         raise ValueError("axis must be a 3-element vector")
-    x, y, z = axis / np.linalg.norm(axis)
+    x, y, z = (float(i) for i in _axis)
+    n = math.hypot(x, y, z)
+    if n == 0:
+        raise ValueError("axis must be a non-zero vector")
+    return _rotation_matrix(math.radians(angle), x / n, y / n, z / n, out)
+
+
+def _rotation_matrix(
+    angle: float, x: float, y: float, z: float, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Return 4x4 rotation matrix for `angle` radians about the unit vector x,y,z.
+
+    Written out already transposed (row-vector convention) from scalars, so that
+    no intermediate lists or transposed copies are created.
+    """
     c, s = math.cos(angle), math.sin(angle)
-    cx, cy, cz = (1 - c) * x, (1 - c) * y, (1 - c) * z
-    M = [
-        [cx * x + c, cy * x - z * s, cz * x + y * s, 0.0],
-        [cx * y + z * s, cy * y + c, cz * y - x * s, 0.0],
-        [cx * z - y * s, cy * z + x * s, cz * z + c, 0.0],
-        [0.0, 0.0, 0.0, 1.0],
-    ]
-    return np.array(M).T
+    t = 1.0 - c
+    cx, cy, cz = t * x, t * y, t * z
+    # fmt: off
+    values = (
+        cx * x + c, cx * y + z * s, cx * z - y * s, 0.0,
+        cy * x - z * s, cy * y + c, cy * z + x * s, 0.0,
+        cz * x + y * s, cz * y - x * s, cz * z + c, 0.0,
+        0.0, 0.0, 0.0, 1.0,
+    )
+    # fmt: on
+    if out is None:
+        return np.array(values).reshape(4, 4)
+    out.flat[:] = values
+    return out
 
 
-def translate(offset: Iterable[float]) -> np.ndarray:
+def translate(offset: Iterable[float], out: np.ndarray | None = None) -> np.ndarray:
     """Translate by an offset (x, y, z) .
 
     Parameters
     ----------
     offset : Iterable[float]
         Must be length 3. Translation in x, y, z.
+    out : ndarray, optional
+        A 4x4 float array to write the matrix into, instead of allocating a new one.
 
     Returns
     -------
@@ -260,24 +415,20 @@ def translate(offset: Iterable[float]) -> np.ndarray:
     _offset = tuple(offset)
     if len(_offset) != 3:
         raise ValueError("offset must be a length 3 sequence")
-    x, y, z = _offset
-    return np.array(
-        [
-            [1.0, 0.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0, 0.0],
-            [0.0, 0.0, 1.0, 0.0],
-            [x, y, z, 1.0],
-        ]
-    )
+    M = _identity(out)
+    M[3, 0], M[3, 1], M[3, 2] = _offset
+    return M
 
 
-def scale(s: Sized) -> np.ndarray:
+def scale(s: Sized, out: np.ndarray | None = None) -> np.ndarray:
     """Non-uniform scaling along the x, y, and z axes.
 
     Parameters
     ----------
     s : array-like, shape (3,)
         Scaling in x, y, z.
+    out : ndarray, optional
+        A 4x4 float array to write the matrix into, instead of allocating a new one.
 
     Returns
     -------
@@ -286,7 +437,42 @@ def scale(s: Sized) -> np.ndarray:
     """
     if len(s) != 3:
         raise ValueError("scale must be a length 3 sequence")
-    return np.array(np.diag(np.concatenate([s, (1.0,)])))
+    M = _identity(out)
+    M.flat[0:11:5] = s  # the first three diagonal elements
+    return M
+
+
+def _identity(out: np.ndarray | None = None) -> np.ndarray:
+    """Return a new 4x4 identity matrix, or reset `out` to the identity."""
+    if out is None:
+        return np.eye(4)
+    out[...] = _IDENTITY
+    return out
+
+
+def _owned_matrix(matrix: ArrayLike | None) -> np.ndarray:
+    """Return a read-only float copy of 4x4 `matrix` (identity if None)."""
+    # always copy: a Transform must own its matrix for caching to be safe
+    _matrix = np.eye(4) if matrix is None else np.array(matrix, dtype=float)
+    if _matrix.shape != (4, 4):
+        raise ValueError(f"Expected 4x4 matrix, got {_matrix.shape}")
+    _matrix.flags.writeable = False
+    return _matrix
+
+
+_scratch = threading.local()
+
+
+def _scratch4x4() -> np.ndarray:
+    """Return this thread's reusable 4x4 buffer for short-lived intermediates.
+
+    Its contents are only valid until the next call in the same thread, so it must
+    never be returned to, or kept by, callers.
+    """
+    buffer: np.ndarray | None = getattr(_scratch, "buffer", None)
+    if buffer is None:
+        buffer = _scratch.buffer = np.empty((4, 4))
+    return buffer
 
 
 def as_vec4(obj: ArrayLike, default: ArrayLike = (0, 0, 0, 1)) -> np.ndarray:
@@ -313,13 +499,30 @@ def as_vec4(obj: ArrayLike, default: ArrayLike = (0, 0, 0, 1)) -> np.ndarray:
     For inputs intended as scale factors, use default=(1,1,1,1).
 
     """
+    if isinstance(obj, np.ndarray) and obj.ndim >= 2 and obj.shape[-1] == 4:
+        return obj
     obj = np.atleast_2d(obj)
     # For multiple vectors, reshape to (..., 4)
-    if obj.shape[-1] < 4:
+    if (n := obj.shape[-1]) < 4:
         new = np.empty(obj.shape[:-1] + (4,), dtype=obj.dtype)
-        new[:] = default
-        new[..., : obj.shape[-1]] = obj
+        new[..., :n] = obj
+        new[..., n:] = np.broadcast_to(default, (4,))[n:]
         obj = new
     elif obj.shape[-1] > 4:
         raise TypeError(f"Array shape {obj.shape} cannot be converted to vec4")
     return obj
+
+
+def _as_vec3(obj: ArrayLike, default: float = 0) -> np.ndarray:
+    """Convert `obj` to a length-3 float vector (x, y, z).
+
+    A cheaper alternative to `as_vec4(obj)[0, :3]` for single positions, offsets
+    and scale factors. Missing trailing entries are filled with `default`, and a
+    4th (w) entry, if present, is dropped.
+    """
+    vec = np.asarray(obj, dtype=float).ravel()
+    if (n := vec.size) < 3:
+        return np.concatenate([vec, np.full(3 - n, default, dtype=float)])
+    if n > 4:
+        raise TypeError(f"Array shape {np.shape(obj)} cannot be converted to vec3")
+    return vec[:3]
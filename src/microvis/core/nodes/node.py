@@ -92,7 +92,7 @@ class Node(FrontEndFor[NodeBackendTypeCoV]):  # type: ignore  # FIXME
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.children._owner = self
-        logger.debug(f"created {type(self)} node {id(self)}")
+        logger.debug("created {} node {}", type(self), id(self))
 
     def __contains__(self, item: Node) -> bool:
         """Return True if this node is an ancestor of item."""
@@ -100,11 +100,15 @@ class Node(FrontEndFor[NodeBackendTypeCoV]):  # type: ignore  # FIXME
 
     def add(self, node: Node) -> None:
         """Add a child node."""
-        nd = f"{node.__class__.__name__} {id(node)}"
-        slf = f"{self.__class__.__name__} {id(self)}"
         node.parent = self
         if node not in self.children:
-            logger.debug(f"Adding node {nd} to {slf}")
+            logger.debug(
+                "Adding node {} {} to {} {}",
+                type(node).__name__,
+                id(node),
+                type(self).__name__,
+                id(self),
+            )
             self.children.append(node)
             if self.has_backend:
                 self.backend_adaptor()._viz_add_node(node)
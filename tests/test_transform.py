@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from microvis.core import Transform
+from microvis.core._transform import as_vec4, rotate, scale, translate
+
+
+@pytest.fixture
+def tform() -> Transform:
+    return (
+        Transform()
+        .translated((1, 2, 3))
+        .rotated(30, (0, 0, 1))
+        .scaled((2, 3, 4), center=(1, 1, 1))
+    )
+
+
+def test_map_imap_roundtrip(tform: Transform) -> None:
+    coords = np.random.random((10, 3))
+    mapped = tform.map(coords)
+    np.testing.assert_allclose(tform.imap(mapped)[:, :3], coords)
+    # repeated calls reuse the cached inverse
+    np.testing.assert_allclose(tform.imap(mapped)[:, :3], coords)
+
+    np.testing.assert_allclose(tform.imap(tform.map([1, 2, 3])), [1, 2, 3, 1])
+
+
+def test_inv(tform: Transform) -> None:
+    np.testing.assert_allclose(
+        tform.inv().matrix, np.linalg.inv(tform.matrix), atol=1e-12
+    )
+    assert (tform @ tform.inv()).is_null()
+    np.testing.assert_allclose(tform.inv().inv().matrix, tform.matrix, atol=1e-12)
+
+
+def test_chain(tform: Transform) -> None:
+    assert Transform.chain().is_null()
+    assert Transform.chain(Transform(), Transform()).is_null()
+    other = Transform().rotated(45, (1, 0, 0))
+    chained = Transform.chain(tform, Transform(), other)
+    np.testing.assert_allclose(chained.matrix, tform.matrix @ other.matrix)
+
+    # near-identity transforms are real transforms and must not be skipped
+    tiny = Transform().translated((1e-9, 0, 0))
+    near = Transform().scaled((1.000005, 1, 1))
+    chained = Transform.chain(tiny, near)
+    np.testing.assert_array_equal(chained.matrix, tiny.matrix @ near.matrix)
+    assert chained.matrix[3, 0] != 0
+    assert chained.matrix[0, 0] == 1.000005
+
+
+def test_map_dtype(tform: Transform) -> None:
+    coords = np.random.random((10, 3))
+    assert tform.map(coords).dtype == np.float64
+    assert tform.map(coords.astype(np.float32)).dtype == np.float32
+    assert tform.imap(coords.astype(np.float32)).dtype == np.float32
+    assert tform.map(np.arange(3)).dtype == np.float64
+    int_coords = np.array([30001, 2, 3], dtype=np.int16)
+    assert tform.map(int_coords).dtype == np.float64
+    assert tform.imap(int_coords).dtype == np.float64
+    np.testing.assert_array_equal(
+        tform.map(int_coords), tform.map(int_coords.astype(np.float64))
+    )
+    np.testing.assert_allclose(
+        tform.map(coords.astype(np.float32)), tform.map(coords), rtol=1e-5, atol=1e-5
+    )
+
+
+def test_imap_projective() -> None:
+    matrix = np.random.random((4, 4)) + np.eye(4)
+    tform = Transform(matrix)
+    coords = np.random.random((2, 5, 4))
+    np.testing.assert_allclose(tform.imap(tform.map(coords)), coords)
+    np.testing.assert_allclose(
+        tform.imap(coords[0]), coords[0] @ np.linalg.inv(matrix), rtol=1e-6
+    )
+
+
+def test_matrix_is_owned_and_read_only(tform: Transform) -> None:
+    matrix = np.eye(4)
+    t = Transform(matrix)
+    t.inv()
+    matrix[3, 0] = 5
+    assert t.is_null()
+    np.testing.assert_array_equal(t.imap([0, 0, 0]), [0, 0, 0, 1])
+
+    for other in (t, tform, tform.inv(), tform.T, tform @ tform):
+        with pytest.raises(ValueError):
+            other.matrix[3, 0] = 100
+
+
+def test_fused_ops_match_unfused_product() -> None:
+    # a non-affine matrix, so every row/column of the fused formulas matters
+    M = np.random.random((4, 4)) + np.eye(4)
+    t = Transform(M)
+    p, c = np.array([1.0, -2.0, 3.0]), np.array([-0.5, 4.0, 2.0])
+
+    np.testing.assert_allclose(t.translated(p).matrix, M @ translate(p))
+    np.testing.assert_allclose(
+        t.rotated(30, (1, 2, 3), about=p).matrix,
+        M @ translate(-p) @ rotate(30, (1, 2, 3)) @ translate(p),
+    )
+    np.testing.assert_allclose(
+        t.scaled((2, 3, 4), center=c).matrix,
+        M @ translate(-c) @ scale((2, 3, 4)) @ translate(c),
+    )
+
+
+def test_rotate_zero_axis() -> None:
+    with pytest.raises(ValueError, match="non-zero"):
+        rotate(10, (0, 0, 0))
+
+
+def test_wrapped_transform_has_events(tform: Transform) -> None:
+    for t in (Transform(), tform, tform.inv(), tform.T, Transform.chain(tform, tform)):
+        assert "matrix" in t.events.signals
+
+
+def test_array_is_read_only(tform: Transform) -> None:
+    arr = np.asarray(tform)
+    assert np.shares_memory(arr, tform.matrix)
+    with pytest.raises(ValueError):
+        arr[3, 0] = 100
+    np.testing.assert_allclose(tform.imap(tform.map([1, 2, 3])), [1, 2, 3, 1])
+    assert np.asarray(tform, dtype=np.float32).flags.writeable
+
+
+def test_copy_resets_caches(tform: Transform) -> None:
+    t = Transform().translated((1, 2, 3))
+    np.testing.assert_array_equal(t.imap([0, 0, 0]), [-1, -2, -3, 1])
+    t.map(np.zeros(3, dtype=np.float32))  # populate the dtype cache too
+
+    matrix = np.eye(4)
+    new = t.copy(update={"matrix": matrix})
+    np.testing.assert_array_equal(new.imap([0, 0, 0]), [0, 0, 0, 1])
+    np.testing.assert_array_equal(new.map(np.zeros(3, dtype=np.float32)), [0, 0, 0, 1])
+    matrix[3, 0] = 5  # the copy owns its matrix
+    assert new.is_null()
+    with pytest.raises(ValueError):
+        new.matrix[3, 0] = 5
+
+    # plain and deep copies keep valid results
+    for other in (tform.copy(), tform.copy(deep=True)):
+        np.testing.assert_allclose(other.imap(tform.map([1, 2, 3])), [1, 2, 3, 1])
+
+
+def test_as_vec4_default() -> None:
+    np.testing.assert_array_equal(as_vec4([1, 2]), [[1, 2, 0, 1]])
+    np.testing.assert_array_equal(as_vec4([1, 2], default=1), [[1, 2, 1, 1]])
+    np.testing.assert_array_equal(
+        as_vec4([[1], [2]], default=(5, 6, 7, 8)), [[1, 6, 7, 8], [2, 6, 7, 8]]
+    )